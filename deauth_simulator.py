@@ -3,28 +3,62 @@
 DeAuthShield Simulator - Realistic WiFi Deauthentication Attack Detection
 Cyberpunk-themed interface with authentic packet visualization and attack simulation
 """
+import os
 import sys
 import random
 import time
 import re
 from collections import deque
-from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QComboBox, QPushButton, QTextEdit, QTabWidget, QGroupBox, QStyleFactory,
+    QComboBox, QPushButton, QTextEdit, QPlainTextEdit, QTabWidget, QGroupBox, QStyleFactory,
     QStatusBar, QProgressBar
 )
 from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QTextCursor
 from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize
 import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+matplotlib.use('QtAgg')
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
 
+_BROADCAST_MAC = "ff:ff:ff:ff:ff:ff"
+_ATTACK_TYPES = ("broadcast", "targeted", "flood")
+_BCAST_REASONS = (1, 4, 5, 8)
+_TARGETED_REASONS = (1, 4, 7)
+_FLOOD_REASONS = (1, 4)
+_NORMAL_REASONS = (1, 4, 5, 7)
+
+# Console line templates, pre-built for every message type and source
+_LOG_PREFIXES = {
+    "info": "[<span style='color:#8be9fd'>{ts}</span>] INFO",
+    "success": "[<span style='color:#50fa7b'>{ts}</span>] SUCCESS",
+    "warning": "[<span style='color:#f1fa8c'>{ts}</span>] WARNING",
+    "alert": "[<span style='color:#ff5555'>{ts}</span>] <b>ALERT</b>",
+}
+_LOG_DEFAULT_PREFIX = "[{ts}]"
+_LOG_SOURCE_TAGS = {
+    "core": "<span style='color:#bd93f9'>[CORE]</span>",
+    "detector": "<span style='color:#ff79c6'>[DETECTOR]</span>",
+    "iface": "<span style='color:#8be9fd'>[IFACE]</span>",
+}
+_LOG_DEFAULT_TAG = "<span style='color:#f1fa8c'>[SYSTEM]</span>"
+_LOG_TEMPLATES = {
+    (msg_type, source): f"{prefix} {tag} {{msg}}"
+    for msg_type, prefix in _LOG_PREFIXES.items()
+    for source, tag in {**_LOG_SOURCE_TAGS, "system": _LOG_DEFAULT_TAG}.items()
+}
+
+def format_packet_entry(timestamp, packet):
+    """Format a packet log row, highlighting attack packets"""
+    ptype = '<span style="color:#ff5555">ATTACK</span>' if packet["attack"] else "DEAUTH"
+    return f"{timestamp}  {packet['src']}  {packet['dst']}  {packet['reason']:^6}  {ptype}"
+
 # Simulated components
 class DeauthDetector(QThread):
     packet_received = pyqtSignal(dict)
+    attack_batch = pyqtSignal(list)
+    plot_tick = pyqtSignal(dict)
     attack_detected = pyqtSignal(str, str, str, str)
     status_update = pyqtSignal(str, str, str)
 
@@ -32,17 +66,22 @@ class DeauthDetector(QThread):
         super().__init__()
         self.running = False
         self.interface = "wlan0"
-        self.packet_history = deque(maxlen=1000)
         self.normal_rate = 0.1  # Packets per second
         self.attack_active = False
         self.stats = {"total": 0, "deauth": 0, "alerts": 0, "broadcast": 0}
         self.start_time = time.time()
         self.last_attack_time = 0
         self.attack_cooldown = 30  # Minimum seconds between attacks
+        self.plot_interval = 0.2  # Minimum seconds between plot updates
+        self._plot_buf = []
+        self._last_plot_emit = 0
+        self._mac_pool = [self.random_mac() for _ in range(1024)]
+        self._last_pool_rotate = time.time()
 
     def run(self):
         self.running = True
         self.status_update.emit("info", "Detection engine started", "core")
+        _rand = random.random
         
         # Packet generation loop
         while self.running:
@@ -50,20 +89,26 @@ class DeauthDetector(QThread):
             current_time = time.time()
             if (not self.attack_active and 
                 current_time - self.last_attack_time > self.attack_cooldown and
-                random.random() < 0.002):  # 0.2% chance to trigger attack
+                _rand() < 0.002):  # 0.2% chance to trigger attack
                 self.simulate_attack()
                 self.last_attack_time = current_time
             
             # Generate normal packets
-            if random.random() < self.normal_rate / 10:
+            if _rand() < self.normal_rate / 10:
                 self.generate_normal_packet()
             
+            # Keep some variety in the MAC pool
+            if current_time - self._last_pool_rotate >= 10:
+                self.rotate_mac_pool()
+                self._last_pool_rotate = current_time
+            
+            self.emit_plot_tick()
             time.sleep(0.1)  # Control simulation speed
 
     def simulate_attack(self):
         """Simulate a deauthentication attack"""
         self.attack_active = True
-        attack_type = random.choice(["broadcast", "targeted", "flood"])
+        attack_type = random.choice(_ATTACK_TYPES)
         duration = random.uniform(2, 6)
         packets = random.randint(15, 50)
         
@@ -71,23 +116,23 @@ class DeauthDetector(QThread):
                                f"Detected potential {attack_type} attack pattern", 
                                "detector")
         
-        # Generate attack packets
-        for i in range(packets):
+        # Generate attack packets on a fixed schedule so sleep overshoot doesn't drift
+        burst = self.generate_burst(attack_type, packets)
+        rows = []
+        interruptible = self.running  # False for a one-off attack with detection off
+        start = time.monotonic()
+        interval = duration / packets
+        aborted = False
+        for i, (src, dst, reason) in enumerate(burst):
+            if interruptible and not self.running:
+                aborted = True
+                break
+            
             if attack_type == "broadcast":
-                src = self.random_mac()
-                dst = "ff:ff:ff:ff:ff:ff"
-                reason = random.choice([1, 4, 5, 8])
                 self.stats["broadcast"] += 1
-            elif attack_type == "targeted":
-                src = self.random_mac()
-                dst = self.random_mac()
-                reason = random.choice([1, 4, 7])
-            else:  # flood
-                src = self.random_mac()
-                dst = random.choice([self.random_mac(), "ff:ff:ff:ff:ff:ff"])
-                reason = random.choice([1, 4])
             
-            self.log_packet(src, dst, reason, attack=True)
+            packet = self.log_packet(src, dst, reason, attack=True)
+            rows.append((packet["timestamp"], self._format_packet_html(packet)))
             
             # Emit attack detection at 30% of attack duration
             if i == int(packets * 0.3):
@@ -96,21 +141,45 @@ class DeauthDetector(QThread):
                                          src, 
                                          dst if attack_type != "broadcast" else "FF:FF:FF:FF:FF:FF")
             
-            time.sleep(duration / packets)
+            remaining = start + (i + 1) * interval - time.monotonic()
+            if remaining > 0:
+                self.msleep(int(remaining * 1000))
         
+        # Hand the whole burst to the packet log in one signal; it is shown once the burst ends
+        self.attack_batch.emit(rows)
         self.attack_active = False
+        if aborted:
+            self.status_update.emit("warning", "Attack simulation aborted", "detector")
+            return
         self.stats["alerts"] += 1
         self.status_update.emit("info", "Attack simulation completed", "detector")
 
+    def generate_burst(self, attack_type, count):
+        """Generate (src, dst, reason) for a whole attack burst up front"""
+        _choices = random.choices
+        srcs = _choices(self._mac_pool, k=count)
+        if attack_type == "broadcast":
+            dsts = [_BROADCAST_MAC] * count
+            reasons = _choices(_BCAST_REASONS, k=count)
+        elif attack_type == "targeted":
+            dsts = _choices(self._mac_pool, k=count)
+            reasons = _choices(_TARGETED_REASONS, k=count)
+        else:  # flood
+            _rand = random.random
+            dsts = [mac if _rand() < 0.5 else _BROADCAST_MAC
+                    for mac in _choices(self._mac_pool, k=count)]
+            reasons = _choices(_FLOOD_REASONS, k=count)
+        return list(zip(srcs, dsts, reasons))
+
     def generate_normal_packet(self):
         """Generate normal network traffic"""
-        src = self.random_mac()
-        dst = random.choice([self.random_mac(), "ff:ff:ff:ff:ff:ff"])
-        reason = random.choice([1, 4, 5, 7])
+        src = self._mac()
+        dst = self._mac() if random.random() < 0.5 else _BROADCAST_MAC
+        reason = random.choice(_NORMAL_REASONS)
         self.log_packet(src, dst, reason)
 
     def log_packet(self, src, dst, reason, attack=False):
-        """Create and log packet"""
+        """Create and log packet; attack packets are logged by their burst"""
         packet = {
             "timestamp": time.time(),
             "src": src,
@@ -118,26 +187,59 @@ class DeauthDetector(QThread):
             "type": "DEAUTH",
             "reason": reason,
             "attack": attack,
-            "info": "Broadcast" if dst == "ff:ff:ff:ff:ff:ff" else "Unicast"
+            "info": "Broadcast" if dst == _BROADCAST_MAC else "Unicast"
         }
         if attack:
             packet["type"] = "ALERT"
         
-        self.packet_history.append(packet)
-        self.packet_received.emit(packet)
+        if not attack:
+            self.packet_received.emit(packet)
         self.stats["total"] += 1
         self.stats["deauth"] += 1
+        
+        self._plot_buf.append(attack)
+        self.emit_plot_tick()
+        return packet
+
+    def _format_packet_html(self, packet):
+        """Format a packet log row from the detector thread"""
+        ts = packet["timestamp"]
+        timestamp = time.strftime("%H:%M:%S", time.localtime(ts))
+        return format_packet_entry(f"{timestamp}.{int((ts % 1) * 1000):03d}", packet)
+
+    def emit_plot_tick(self):
+        """Emit buffered packets to the plot at most once per plot interval"""
+        now = time.time()
+        if not self._plot_buf or now - self._last_plot_emit < self.plot_interval:
+            return
+        
+        self._last_plot_emit = now
+        self.plot_tick.emit({"count": len(self._plot_buf), "attack": any(self._plot_buf)})
+        self._plot_buf = []
 
     def random_mac(self):
-        """Generate random MAC address"""
-        return ":".join([f"{random.randint(0, 255):02x}" for _ in range(6)]).upper()
+        """Generate random unicast MAC address"""
+        mac = bytearray(os.urandom(6))
+        mac[0] &= 0xFE  # Clear multicast bit, broadcast is only used explicitly
+        return mac.hex(":").upper()
+
+    def _mac(self):
+        """Draw a MAC address from the pre-generated pool"""
+        return random.choice(self._mac_pool)
+
+    def rotate_mac_pool(self, count=32):
+        """Replace a few pool entries with fresh addresses"""
+        for _ in range(count):
+            self._mac_pool[random.randrange(len(self._mac_pool))] = self.random_mac()
 
     def get_stats(self):
         """Get current statistics"""
         uptime = time.time() - self.start_time
         rate = self.stats["deauth"] / uptime if uptime > 0 else 0
+        hours, rem = divmod(int(uptime), 3600)
+        minutes, seconds = divmod(rem, 60)
         return {
-            "uptime": str(datetime.utcfromtimestamp(uptime).strftime('%H:%M:%S')),
+            "uptime": f"{hours:02d}:{minutes:02d}:{seconds:02d}",
             "deauth": self.stats["deauth"],
             "rate": f"{rate:.1f}",
             "alerts": self.stats["alerts"],
@@ -159,67 +261,105 @@ class PlotCanvas(FigureCanvasQTAgg):
         self.ax = self.fig.add_subplot(111, facecolor='#0f1923')
         self.data = deque(maxlen=100)
         self.timestamps = deque(maxlen=100)
-        self.attack_points = []
-        self.last_update = 0
+        self.attack_flags = deque(maxlen=100)  # Aligned with timestamps
+        self.x_span = 30  # Seconds of timeline visible at once
+        self.bg = None
         self.setStyleSheet("background-color: #0f1923; border: 1px solid #1e90ff;")
-
-    def update_plot(self, packet):
-        """Update plot with new packet data"""
+        
+        # Style plot once - updates only touch the artists below
         now = time.time()
+        self.ax.set_xlim(now, now + self.x_span)
+        self.ax.set_ylim(0, 15)
+        self.ax.xaxis.set_major_locator(MaxNLocator(5))
+        self.ax.yaxis.set_major_locator(MaxNLocator(4))
+        self.ax.tick_params(axis='x', colors='#e0e0e0', labelsize=8)
+        self.ax.tick_params(axis='y', colors='#e0e0e0', labelsize=8)
+        self.ax.set_title('DeAuth Packet Rate Timeline', color='#00ff9f', fontsize=10)
+        self.ax.set_ylabel('Packet Rate', color='#e0e0e0', fontsize=9)
+        self.ax.grid(True, linestyle='--', alpha=0.3, color='#1e90ff')
         
-        # Only update plot every 200ms for performance
-        if now - self.last_update < 0.2:
-            return
+        # Animated artists are skipped by full draws and blitted on top
+        self.traffic_line, = self.ax.plot([], [], color='#1f77b4', label='Traffic', animated=True)
+        self.attack_scatter, = self.ax.plot([], [], 'ro', markersize=6, label='Attack', animated=True)
+        self.legend = self.ax.legend(loc='upper right', fontsize=8, facecolor='#0c0e15', edgecolor='#1e90ff')
+        self.legend.set_animated(True)  # Blitted last so markers never cover it
         
-        self.last_update = now
-        self.data.append(10)  # Spike for each packet
+        self.mpl_connect('draw_event', self.on_draw)
+        # Static margins - no layout solver runs on redraws or resizes
+        self.fig.subplots_adjust(left=0.1, right=0.98, top=0.9, bottom=0.15)
+        self.draw()
+
+    def on_draw(self, event):
+        """Re-capture the static background after every full redraw (e.g. resize)"""
+        self.bg = self.copy_from_bbox(self.ax.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        """Render the dynamic artists over the current background"""
+        self.ax.draw_artist(self.traffic_line)
+        self.ax.draw_artist(self.attack_scatter)
+        self.ax.draw_artist(self.legend)
+
+    def update_plot(self, tick):
+        """Update plot with packets aggregated since the last tick"""
+        now = time.time()
+        self.data.append(min(14, 9 + tick["count"]))  # Spike per tick, taller for bursts
         
         # Smooth decay
         if len(self.data) > 1:
             self.data[-2] = max(0, self.data[-2] * 0.7)
         
         self.timestamps.append(now)
+        self.attack_flags.append(tick["attack"])
         
-        if packet["attack"]:
-            self.attack_points.append(now)
+        # Keep collecting history while hidden, but skip all drawing
+        if not self.isVisible():
+            return
         
-        self.ax.clear()
+        # Scrolling the timeline needs a full redraw of ticks and background
+        if self.refresh_artists():
+            self.draw_idle()
+            return
         
-        # Plot packet rate as area chart
-        self.ax.fill_between(self.timestamps, 0, self.data, color='#1f77b4', alpha=0.8, label='Traffic')
+        self.restore_region(self.bg)
+        self.draw_animated()
+        self.blit(self.ax.bbox)
+
+    def refresh_artists(self):
+        """Push buffered samples into the artists; returns True if the timeline scrolled"""
+        self.traffic_line.set_data(list(self.timestamps), list(self.data))
         
         # Mark attack points
-        for point in self.attack_points:
-            if point in self.timestamps:
-                idx = list(self.timestamps).index(point)
-                self.ax.plot(point, self.data[idx], 'ro', markersize=6, label='Attack' if idx == 0 else "")
-        
-        # Style plot
-        self.ax.set_ylim(0, 15)
-        self.ax.xaxis.set_major_locator(MaxNLocator(5))
-        self.ax.yaxis.set_major_locator(MaxNLocator(4))
-        self.ax.tick_params(axis='x', colors='#e0e0e0', labelsize=8)
-        self.ax.tick_params(axis='y', colors='#e0e0e0', labelsize=8)
-        self.ax.set_title('DeAuth Packet Rate Timeline', color='#00ff9f', fontsize=10)
-        self.ax.set_ylabel('Packet Rate', color='#e0e0e0', fontsize=9)
-        
-        # Add grid
-        self.ax.grid(True, linestyle='--', alpha=0.3, color='#1e90ff')
-        
-        # Only show legend for first attack point
-        handles, labels = self.ax.get_legend_handles_labels()
-        if labels:
-            self.ax.legend(handles, labels, loc='upper right', fontsize=8, 
-                          facecolor='#0c0e15', edgecolor='#1e90ff')
-        
-        self.fig.tight_layout()
-        self.draw()
+        attack_points = [(t, v) for t, v, attack in zip(self.timestamps, self.data, self.attack_flags) if attack]
+        self.attack_scatter.set_data(*zip(*attack_points) if attack_points else ([], []))
+        
+        if not self.timestamps or self.timestamps[-1] <= self.ax.get_xlim()[1]:
+            return False
+        latest = self.timestamps[-1]
+        self.ax.set_xlim(latest - self.x_span * 0.75, latest + self.x_span * 0.25)
+        return True
+
+    def showEvent(self, event):
+        """Catch up on samples collected while the canvas was hidden"""
+        super().showEvent(event)
+        self.refresh_artists()
+        self.draw_idle()
 
 class DeAuthShieldGUI(QMainWindow):
     """Cyberpunk-themed main application window with realistic output"""
     def __init__(self):
         super().__init__()
         self.detector = DeauthDetector()
+        self._ts_sec = 0  # Second currently cached in _ts_str
+        self._ts_str = ''
+        
+        # Log lines are buffered and flushed to the widgets in batches
+        self._console_buf, self._packet_buf, self._alert_buf = deque(), deque(), deque()
+        self._pending_console = deque(maxlen=2000)  # Raw messages while the Console tab is hidden
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        self._log_flush_timer.start(100)
+        
         self.setup_ui()
         self.setup_connections()
         self.setWindowTitle("DeAuthShield v1.0 - WiFi Deauthentication Detector")
@@ -228,6 +368,12 @@ class DeAuthShieldGUI(QMainWindow):
 
     def setup_ui(self):
         """Initialize UI components with realistic elements"""
+        # Shared fonts, built once and reused by every widget below
+        mono9 = QFont("Monospace", 9)
+        mono8 = QFont("Monospace", 8)
+        logo_font = QFont("Courier New", 16, QFont.Weight.Bold)
+        led_font = QFont("Arial", 12)
+        
         central_widget = QWidget()
         main_layout = QHBoxLayout()
         main_layout.setSpacing(10)
@@ -242,15 +388,14 @@ class DeAuthShieldGUI(QMainWindow):
         header = QWidget()
         header_layout = QHBoxLayout()
         logo = QLabel("DeAuthShield")
-        logo.setFont(QFont("Courier New", 16, QFont.Weight.Bold))
+        logo.setFont(logo_font)
         logo.setStyleSheet("color: #00ff9f;")
         header_layout.addWidget(logo)
         header_layout.addStretch()
-        status_led = QLabel("●")
-        status_led.setFont(QFont("Arial", 12))
-        status_led.setStyleSheet("color: #ff5555;")
-        status_led.setObjectName("status_led")
-        header_layout.addWidget(status_led)
+        self.status_led = QLabel("●")
+        self.status_led.setFont(led_font)
+        self.status_led.setStyleSheet("color: #ff5555;")
+        header_layout.addWidget(self.status_led)
         header.setLayout(header_layout)
         left_panel.addWidget(header)
         
@@ -298,7 +443,7 @@ class DeAuthShieldGUI(QMainWindow):
         self.stats_label = QLabel(
             "Uptime: 00:00:00 | Deauth: 0 | Rate: 0.0 pkt/s | Alerts: 0"
         )
-        self.stats_label.setFont(QFont("Monospace", 9))
+        self.stats_label.setFont(mono9)
         self.stats_label.setStyleSheet("color: #e0e0e0;")
         
         details_layout = QVBoxLayout()
@@ -307,7 +452,7 @@ class DeAuthShieldGUI(QMainWindow):
         self.channel_label = QLabel("Channel: 6 (2.437 GHz)")
         
         for label in [self.iface_label, self.mac_label, self.channel_label]:
-            label.setFont(QFont("Monospace", 8))
+            label.setFont(mono8)
             details_layout.addWidget(label)
         
         stats_layout.addWidget(self.stats_label)
@@ -365,40 +510,44 @@ class DeAuthShieldGUI(QMainWindow):
         right_panel.addWidget(self.plot_canvas)
         
         # Log tabs
-        log_tabs = QTabWidget()
-        log_tabs.setDocumentMode(True)
+        self.log_tabs = QTabWidget()
+        self.log_tabs.setDocumentMode(True)
         
         # Console log
         self.console_log = QTextEdit()
         self.console_log.setReadOnly(True)
-        self.console_log.setFont(QFont("Monospace", 9))
+        self.console_log.setFont(mono9)
+        self.console_log.document().setMaximumBlockCount(2000)
         
         # Packet log with headers
-        self.packet_log = QTextEdit()
+        self.packet_log = QPlainTextEdit()
         self.packet_log.setReadOnly(True)
-        self.packet_log.setFont(QFont("Monospace", 9))
-        self.packet_log.append(
+        self.packet_log.setFont(mono9)
+        self.packet_log.setMaximumBlockCount(2000)
+        self.packet_log.appendPlainText(
             "   Timestamp     Source MAC       Destination MAC    Reason  Type     "
         )
-        self.packet_log.append(
+        self.packet_log.appendPlainText(
             "---------------------------------------------------------------------"
         )
         
         # Alert log
-        self.alert_log = QTextEdit()
+        self.alert_log = QPlainTextEdit()
         self.alert_log.setReadOnly(True)
-        self.alert_log.setFont(QFont("Monospace", 9))
-        self.alert_log.append(
+        self.alert_log.setFont(mono9)
+        self.alert_log.setMaximumBlockCount(2000)
+        self.alert_log.appendPlainText(
             "   Timestamp     Alert Level      Description                       "
         )
-        self.alert_log.append(
+        self.alert_log.appendPlainText(
             "---------------------------------------------------------------------"
         )
         
-        log_tabs.addTab(self.console_log, "Console")
-        log_tabs.addTab(self.packet_log, "Packet Log")
-        log_tabs.addTab(self.alert_log, "Security Alerts")
-        right_panel.addWidget(log_tabs, 1)
+        self.log_tabs.addTab(self.console_log, "Console")
+        self.log_tabs.addTab(self.packet_log, "Packet Log")
+        self.log_tabs.addTab(self.alert_log, "Security Alerts")
+        self.log_tabs.currentChanged.connect(self.drain_pending_console)
+        right_panel.addWidget(self.log_tabs, 1)
         
         # Combine panels
         main_layout.addLayout(left_panel, 1)
@@ -475,7 +624,7 @@ class DeAuthShieldGUI(QMainWindow):
             color: #5f6b7d;
             border: 1px solid #1a2639;
         }
-        QTextEdit {
+        QTextEdit, QPlainTextEdit {
             background-color: #0f1923;
             color: #e0e0e0;
             border: 1px solid #1e90ff;
@@ -533,8 +682,10 @@ class DeAuthShieldGUI(QMainWindow):
     def setup_connections(self):
         """Connect signals and slots"""
         self.detector.packet_received.connect(self.handle_packet)
+        self.detector.attack_batch.connect(self.handle_attack_batch)
+        self.detector.plot_tick.connect(self.plot_canvas.update_plot)
         self.detector.attack_detected.connect(self.handle_attack)
-        self.detector.status_update.connect(self.log_message)
+        self.detector.status_update.connect(self.handle_status)
         
         self.start_btn.clicked.connect(self.start_detection)
         self.stop_btn.clicked.connect(self.stop_detection)
@@ -551,7 +702,7 @@ class DeAuthShieldGUI(QMainWindow):
         self.log_message("console", "Sniffing deauthentication packets...", "info", "detector")
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
-        self.findChild(QLabel, "status_led").setStyleSheet("color: #50fa7b;")
+        self.status_led.setStyleSheet("color: #50fa7b;")
 
     def stop_detection(self):
         """Stop detection simulation"""
@@ -559,7 +710,7 @@ class DeAuthShieldGUI(QMainWindow):
         self.log_message("console", "Detection stopped", "info", "core")
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
-        self.findChild(QLabel, "status_led").setStyleSheet("color: #ff5555;")
+        self.status_led.setStyleSheet("color: #ff5555;")
 
     def enable_monitor_mode(self):
         """Simulate monitor mode activation with progress"""
@@ -595,36 +746,29 @@ class DeAuthShieldGUI(QMainWindow):
         self.interface_combo.clear()
         self.interface_combo.addItems(["wlan0", "wlan1", "wlp3s0"])
 
+    def _fmt_ts(self, ts, millis=True):
+        """Format a timestamp as HH:MM:SS[.mmm], reusing the cached second"""
+        sec = int(ts)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        if not millis:
+            return self._ts_str
+        return f"{self._ts_str}.{int((ts - sec) * 1000):03d}"
+
     def handle_packet(self, packet):
         """Process simulated packet with realistic output"""
-        # Update visualization
-        self.plot_canvas.update_plot(packet)
-        
-        # Format packet for log
-        timestamp = datetime.fromtimestamp(packet["timestamp"]).strftime("%H:%M:%S.%f")[:-3]
-        src = packet["src"]
-        dst = packet["dst"]
-        reason = packet["reason"]
-        ptype = "DEAUTH" if not packet["attack"] else "ATTACK"
-        
-        # Create log entry
-        log_entry = (
-            f"{timestamp}  {src}  {dst}  {reason:^6}  "
-            f"{'<span style=\"color:#ff5555\">ATTACK</span>' if packet['attack'] else 'DEAUTH'}"
-        )
-        
-        # Add to packet log
-        self.packet_log.append(log_entry)
-        
-        # Scroll to bottom
-        self.packet_log.verticalScrollBar().setValue(
-            self.packet_log.verticalScrollBar().maximum()
-        )
+        # Queue for packet log
+        self._packet_buf.append((packet["timestamp"], format_packet_entry(self._fmt_ts(packet["timestamp"]), packet)))
+
+    def handle_attack_batch(self, rows):
+        """Queue a finished attack burst's (timestamp, row) pairs for the packet log"""
+        self._packet_buf.extend(rows)
 
     def handle_attack(self, attack_type, details, src, dst):
         """Handle attack detection with realistic alerts"""
         # Create alert message
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        timestamp = self._fmt_ts(time.time())
         
         if attack_type == "broadcast":
             alert_msg = f"Broadcast deauthentication attack detected! {details}"
@@ -642,68 +786,88 @@ class DeAuthShieldGUI(QMainWindow):
         # Log to console
         self.log_message("console", alert_msg, "alert", "detector")
         
-        # Log to alert tab
-        self.alert_log.append(
+        # Queue for alert tab
+        self._alert_buf.append(
             f"{timestamp}  {severity:<8}  {alert_msg}"
         )
         
         # Add MAC details
-        self.alert_log.append(
+        self._alert_buf.append(
             f"{' ' * len(timestamp)}            Source: {src} → Target: {dst}"
         )
-        self.alert_log.append(
+        self._alert_buf.append(
             f"{' ' * len(timestamp)}            Reason: Possible rogue device or attack tool"
         )
         
-        # Scroll to bottom
-        self.alert_log.verticalScrollBar().setValue(
-            self.alert_log.verticalScrollBar().maximum()
-        )
-        
         # Flash UI
-        self.findChild(QLabel, "status_led").setStyleSheet("color: #ff5555;")
-        QTimer.singleShot(500, lambda: self.findChild(QLabel, "status_led").setStyleSheet(
-            "color: #50fa7b;" if self.detector.isRunning() else "#ff5555;"
+        led = self.status_led
+        detector = self.detector
+        led.setStyleSheet("color: #ff5555;")
+        QTimer.singleShot(500, lambda: led.setStyleSheet(
+            "color: #50fa7b;" if detector.isRunning() else "color: #ff5555;"
         ))
 
+    def handle_status(self, msg_type, message, source):
+        """Route detector status updates to the console log"""
+        self.log_message("console", message, msg_type, source)
+
     def log_message(self, log_type, message, msg_type="info", source="system"):
         """Log message with realistic formatting"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        if msg_type == "info":
-            prefix = f"[<span style='color:#8be9fd'>{timestamp}</span>] INFO"
-            color = ""
-        elif msg_type == "success":
-            prefix = f"[<span style='color:#50fa7b'>{timestamp}</span>] SUCCESS"
-            color = "color:#50fa7b;"
-        elif msg_type == "warning":
-            prefix = f"[<span style='color:#f1fa8c'>{timestamp}</span>] WARNING"
-            color = "color:#f1fa8c;"
-        elif msg_type == "alert":
-            prefix = f"[<span style='color:#ff5555'>{timestamp}</span>] <b>ALERT</b>"
-            color = "color:#ff5555;"
-        else:
-            prefix = f"[{timestamp}]"
-            color = ""
-        
-        # Add source tag
-        if source == "core":
-            source_tag = "<span style='color:#bd93f9'>[CORE]</span>"
-        elif source == "detector":
-            source_tag = "<span style='color:#ff79c6'>[DETECTOR]</span>"
-        elif source == "iface":
-            source_tag = "<span style='color:#8be9fd'>[IFACE]</span>"
-        else:
-            source_tag = "<span style='color:#f1fa8c'>[SYSTEM]</span>"
+        if log_type != "console":
+            return
+        
+        timestamp = self._fmt_ts(time.time(), millis=False)
         
-        formatted_msg = f"{prefix} {source_tag} {message}"
+        # Defer HTML formatting until the Console tab is shown
+        if self.log_tabs.currentWidget() is not self.console_log:
+            self._pending_console.append((timestamp, message, msg_type, source))
+            return
         
-        if log_type == "console":
-            self.console_log.append(formatted_msg)
+        self._console_buf.append(self.format_log(timestamp, message, msg_type, source))
+
+    def drain_pending_console(self, index):
+        """Format messages logged while the Console tab was hidden"""
+        if self.log_tabs.widget(index) is not self.console_log:
+            return
+        
+        while self._pending_console:
+            self._console_buf.append(self.format_log(*self._pending_console.popleft()))
+
+    def format_log(self, timestamp, message, msg_type, source):
+        """Build the HTML console line for a message"""
+        template = _LOG_TEMPLATES.get((msg_type, source))
+        if template is None:
+            template = (f"{_LOG_PREFIXES.get(msg_type, _LOG_DEFAULT_PREFIX)} "
+                        f"{_LOG_SOURCE_TAGS.get(source, _LOG_DEFAULT_TAG)} {{msg}}")
+        return template.format(ts=timestamp, msg=message)
+
+    def _flush_logs(self):
+        """Write buffered log lines to their widgets in one edit block each"""
+        # A burst's rows arrive when it ends, so merge them with rows logged meanwhile by timestamp
+        packet_rows = [row for _, row in sorted(self._packet_buf, key=lambda entry: entry[0])]
+        self._packet_buf.clear()
+        for edit, buf, rich in ((self.console_log, self._console_buf, True),
+                                (self.packet_log, packet_rows, True),
+                                (self.alert_log, self._alert_buf, False)):
+            if not buf:
+                continue
+            
+            if rich:
+                cursor = edit.textCursor()
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                cursor.beginEditBlock()
+                for line in buf:
+                    if not edit.document().isEmpty():
+                        cursor.insertBlock()
+                    # Keep column alignment, which HTML would otherwise collapse
+                    cursor.insertHtml(f"<span style='white-space:pre'>{line}</span>")
+                cursor.endEditBlock()
+            else:
+                edit.appendPlainText("\n".join(buf))
+            buf.clear()
+            
             # Scroll to bottom
-            self.console_log.verticalScrollBar().setValue(
-                self.console_log.verticalScrollBar().maximum()
-            )
+            edit.verticalScrollBar().setValue(edit.verticalScrollBar().maximum())
 
     def update_stats(self):
         """Update statistics display with realistic values"""
@@ -736,23 +900,27 @@ class DeAuthShieldGUI(QMainWindow):
 
     def clear_logs(self):
         """Clear all log displays with realistic preservation"""
+        self._console_buf.clear()
+        self._pending_console.clear()
+        self._packet_buf.clear()
+        self._alert_buf.clear()
         self.console_log.clear()
         
         # Preserve headers in packet log
         self.packet_log.clear()
-        self.packet_log.append(
+        self.packet_log.appendPlainText(
             "   Timestamp     Source MAC       Destination MAC    Reason  Type     "
         )
-        self.packet_log.append(
+        self.packet_log.appendPlainText(
             "---------------------------------------------------------------------"
         )
         
         # Preserve headers in alert log
         self.alert_log.clear()
-        self.alert_log.append(
+        self.alert_log.appendPlainText(
             "   Timestamp     Alert Level      Description                       "
         )
-        self.alert_log.append(
+        self.alert_log.appendPlainText(
             "---------------------------------------------------------------------"
         )
         
@@ -1,43 +1,347 @@
 # detector.py
-from scapy.all import sniff, Dot11Deauth
+from scapy.all import RadioTap, RawPcapReader, Scapy_Exception, conf
+from scapy.data import DLT_IEEE802_11_RADIO
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from datetime import datetime
+import numpy as np
+import select
+import shutil
+import socket
+import subprocess
+import sys
 import threading
 import time
 
+monotonic = time.monotonic
 
-class DeAuthDetector(threading.Thread):
-    def __init__(self, interface, threshold, time_window, log_path, console_output):
+# Kernel-side BPF filter so only deauth frames reach Python (needs an 802.11 monitor interface)
+DEAUTH_BPF = "type mgt subtype deauth"
+
+# Kernel receive buffer for the capture socket, so bursts queue in the kernel instead of dropping
+CAPTURE_RCVBUF = 16 * 1024 * 1024
+
+# How long start() waits to see whether tcpdump dies on startup (bad interface, no permission)
+TCPDUMP_STARTUP_WAIT = 0.3
+
+# Suspicious-MAC table bounds: spoofed floods can't grow it past MAX_SUSPICIOUS_MACS,
+# and the stats label only lists the MACS_SHOWN most-alerted of them
+MAX_SUSPICIOUS_MACS = 256
+MACS_SHOWN = 10
+
+# First frame-control byte of a management/deauthentication frame
+DEAUTH_FC = 0xC0
+
+
+# MACs are tracked as 48-bit ints and only formatted back for log lines and the stats text
+def int_to_mac(value):
+    return value.to_bytes(6, "big").hex(":")
+
+
+# Reads addr2 straight out of a RadioTap + 802.11 frame instead of dissecting it with scapy.
+# Returns None for anything that isn't a deauth frame. Callers must only pass frames from a
+# RadioTap link: the version-byte check alone can't tell an Ethernet frame apart.
+def parse_deauth_addr2(buf):
+    if len(buf) < 4 or buf[0] != 0:
+        return None
+    off = int.from_bytes(buf[2:4], "little")
+    # frame control (2) + duration (2) + addr1 (6) + addr2 (6)
+    if len(buf) < off + 16 or buf[off] != DEAUTH_FC:
+        return None
+    return int.from_bytes(buf[off + 10:off + 16], "big")
+
+
+# Count-min sketch over two tumbling panes, blended into an approximate sliding window.
+# Memory stays fixed however many source MACs an attacker spoofs; estimates only err high.
+class WindowSketch:
+    def __init__(self, window, depth=4, width=4096):
+        self.window = window
+        self.rows = np.arange(depth)[:, None]
+        self.shift = np.uint64(64 - (width - 1).bit_length())  # multiply-shift keeps the top log2(width) bits
+        self.seeds = (np.random.default_rng().integers(1, 2**63, depth, dtype=np.uint64) | np.uint64(1))[:, None]
+        self.current = np.zeros((depth, width), dtype=np.uint32)
+        self.previous = np.zeros_like(self.current)
+        self.pane_start = None
+
+    def slide(self, now):
+        if self.pane_start is None:
+            self.pane_start = now
+        elapsed = now - self.pane_start
+        if elapsed >= 2 * self.window:
+            self.current[:] = 0
+            self.previous[:] = 0
+            self.pane_start = now
+        elif elapsed >= self.window:
+            self.previous[:] = self.current
+            self.current[:] = 0
+            self.pane_start += self.window
+
+    def add(self, macs, now):
+        self.slide(now)
+        cells = (np.asarray(macs, dtype=np.uint64) * self.seeds) >> self.shift
+        np.add.at(self.current, (self.rows, cells), 1)
+        return cells
+
+    def estimate(self, cells, now):
+        # The previous pane counts for the share of it still inside the sliding window
+        weight = max(0.0, 1.0 - (now - self.pane_start) / self.window)
+        counts = self.current[self.rows, cells] + weight * self.previous[self.rows, cells]
+        return counts.min(axis=0)
+
+
+# Lock-free single-producer/single-consumer ring between the capture thread and the GUI thread.
+# Only the producer writes head and only the consumer writes tail; CPython publishes each int store whole.
+class SPSCRing:
+    def __init__(self, size=65536):
+        self.slots = [None] * size
+        self.mask = size - 1
+        self.head = 0
+        self.tail = 0
+        self.dropped = 0  # only written by the producer
+
+    def push(self, item):
+        head = self.head
+        if head - self.tail > self.mask:
+            self.dropped += 1
+            return
+        self.slots[head & self.mask] = item
+        self.head = head + 1  # publish only after the slot is written
+
+    def drain(self):
+        tail, head = self.tail, self.head
+        if tail == head:
+            return []
+        start, end = tail & self.mask, head & self.mask
+        if start < end:
+            items = self.slots[start:end]
+        else:
+            items = self.slots[start:] + self.slots[:end]
+        self.tail = head
+        return items
+
+
+def open_capture(iface, filter=None):
+    if sys.platform.startswith("linux"):
+        # Scapy's native PF_PACKET socket, whatever conf.L2listen points at, with a bigger SO_RCVBUF.
+        # Set on this socket only, so scapy's process-wide conf is left alone.
+        from scapy.arch.linux import L2ListenSocket
+        sock = L2ListenSocket(iface=iface, filter=filter)
+        sock.ins.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, CAPTURE_RCVBUF)
+        return sock
+    # Elsewhere this is libpcap's L2pcapListenSocket, which already puts BSD/macOS handles into
+    # immediate mode (BIOCIMMEDIATE) and applies conf.except_filter
+    return conf.L2listen(iface=iface, filter=filter)
+
+
+def tcpdump_error(proc):
+    # tcpdump's stderr folded onto one line for the console
+    text = " ".join(proc.stderr.read().decode(errors="replace").split())
+    proc.stderr.close()
+    return f": {text}" if text else ""
+
+
+class DeAuthDetector(QObject):
+    # One joined message per batch, so the console re-lays out once per batch
+    log_batch = pyqtSignal(str)
+
+    def __init__(self, interface, threshold, time_window, log_path, batch_interval=1 / 30):
         super().__init__()
         self.interface = interface
-        self.threshold = threshold
-        self.time_window = time_window
+        self.threshold = int(threshold)
+        self.time_window = float(time_window)
         self.log_path = log_path
-        self.console_output = console_output
+        self.batch_interval = batch_interval
+        self.log_file = None  # opened by start()
 
-        self.packet_times = []
-        self.suspicious_macs = set()
+        self.ring = SPSCRing()  # (timestamp, mac int) pushed by the capture thread
+        self._dropped_reported = 0
+        self.sketch = WindowSketch(self.time_window)  # approximate per-MAC counts inside time_window
+        self._alert_suffix = f" in {self.time_window:g}s"
+        self.suspicious_macs = {}  # 48-bit MAC -> alerts raised for it, capped at MAX_SUSPICIOUS_MACS
+        self._mac_list_cache = "[]"
+        self._mac_list_dirty = False
         self.total_deauth_packets = 0
         self.alerts_triggered = 0
+        self.running = False
+
+        # Batches are processed on the GUI thread; only the capture thread runs in the background
+        self.capture_thread = None
+        self.proc = None
+        self.batch_timer = QTimer()
+        self.batch_timer.timeout.connect(self.process_batch)
+        self.flush_timer = QTimer()
+        self.flush_timer.timeout.connect(self.flush_log)
+
+    def start(self):
+        if self.log_path:
+            try:
+                self.log_file = open(self.log_path, 'a', buffering=1024 * 1024)
+            except OSError as e:
+                self.log_batch.emit(f"[-] Could not open log file {self.log_path}: {e}")
+                return False
+        tcpdump = shutil.which("tcpdump")
+        self.proc = self.spawn_tcpdump(tcpdump) if tcpdump else None
+        if self.proc:
+            target, args = self.tcpdump_loop, (self.proc,)
+        else:
+            try:
+                sock = self.open_socket()
+            except Exception as e:
+                self.log_batch.emit(f"[-] Could not open {self.interface} for capture: {e}")
+                if self.log_file:
+                    self.log_file.close()
+                    self.log_file = None
+                return False
+            target, args = self.capture_loop, (sock,)
         self.running = True
+        self.capture_thread = threading.Thread(target=target, args=args, daemon=True)
+        self.capture_thread.start()
+        self.batch_timer.start(int(self.batch_interval * 1000))
+        if self.log_file:
+            self.flush_timer.start(1000)
+        return True
+
+    def spawn_tcpdump(self, tcpdump):
+        # tcpdump captures and filters natively; Python only reads the matching frames off its pcap stream.
+        # --immediate-mode hands each frame over at once instead of on libpcap's 1 s buffer timeout.
+        try:
+            proc = subprocess.Popen([tcpdump, "-i", self.interface, "--immediate-mode", "-U", "-w", "-",
+                                     *DEAUTH_BPF.split()], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            self.log_batch.emit(f"[~] Could not run tcpdump ({e}), capturing with scapy instead")
+            return None
+        try:
+            status = proc.wait(timeout=TCPDUMP_STARTUP_WAIT)
+        except subprocess.TimeoutExpired:
+            return proc
+        proc.stdout.close()
+        self.log_batch.emit(f"[~] tcpdump exited with status {status}{tcpdump_error(proc)}, capturing with scapy instead")
+        return None
+
+    def open_socket(self):
+        try:
+            return open_capture(self.interface, DEAUTH_BPF)
+        except Scapy_Exception as e:
+            self.log_batch.emit(f"[~] Kernel deauth filter unavailable ({e}), filtering in Python")
+            return open_capture(self.interface)
+
+    def stop(self):
+        if not self.running:
+            return
+        self.running = False
+        # Killing tcpdump closes the pipe; the socket loop re-checks running at least every 200 ms
+        if self.proc:
+            self.proc.terminate()
+        if self.capture_thread:
+            self.capture_thread.join(timeout=1)
+        if self.proc:
+            self.proc.wait()
+            self.proc.stderr.close()
+            self.proc = None
+        self.batch_timer.stop()
+        self.flush_timer.stop()
+        self.process_batch()
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+
+    def tcpdump_loop(self, proc):
+        push = self.ring.push
+        try:
+            reader = RawPcapReader(proc.stdout)
+            if reader.linktype != DLT_IEEE802_11_RADIO:
+                self.log_batch.emit(f"[-] {self.interface} delivers link type {reader.linktype}, not RadioTap; "
+                                    f"put it in monitor mode")
+                proc.terminate()
+                return
+            for buf, meta in reader:
+                mac = parse_deauth_addr2(buf)
+                if mac is not None:
+                    push((meta.sec + meta.usec / 1e6, mac))
+        except Scapy_Exception:
+            pass  # tcpdump exited before writing a pcap header
+        finally:
+            proc.stdout.close()
+        if self.running:
+            self.log_batch.emit(f"[~] tcpdump exited with status {proc.wait()}{tcpdump_error(proc)}")
+
+    def capture_loop(self, sock):
+        # Raw frames only; scapy never dissects them
+        push = self.ring.push
+        try:
+            while self.running:
+                if not select.select([sock], [], [], 0.2)[0]:
+                    continue
+                cls, buf, ts = sock.recv_raw()
+                # Only RadioTap frames have the layout parse_deauth_addr2 reads
+                if not buf or cls is not RadioTap:
+                    continue
+                mac = parse_deauth_addr2(buf)
+                if mac is not None:
+                    push((ts or time.time(), mac))
+        finally:
+            sock.close()
+
+    def flush_log(self):
+        if self.log_file:
+            self.log_file.flush()
+
+    def mac_list_text(self):
+        # Re-stringified only after an alert changed the table
+        if self._mac_list_dirty:
+            macs = self.suspicious_macs
+            top = sorted(macs, key=macs.get, reverse=True)[:MACS_SHOWN]
+            text = str([int_to_mac(mac) for mac in top])
+            if len(macs) > len(top):
+                text += f" +{len(macs) - len(top)} more"
+            self._mac_list_cache = text
+            self._mac_list_dirty = False
+        return self._mac_list_cache
+
+    def flag_mac(self, mac):
+        macs = self.suspicious_macs
+        if mac not in macs and len(macs) >= MAX_SUSPICIOUS_MACS:
+            # Table full: the least-alerted MAC makes room, so persistent attackers stay listed
+            del macs[min(macs, key=macs.get)]
+        macs[mac] = macs.get(mac, 0) + 1
+        self._mac_list_dirty = True
+
+    def alert_scan(self, macs, estimates, log):
+        # One numpy comparison for the batch; only MACs that crossed the threshold are visited in Python
+        alerted = set()
+        for i in np.flatnonzero(estimates >= self.threshold):
+            mac = macs[i]
+            if mac not in alerted:
+                alerted.add(mac)
+                self.flag_mac(mac)
+                log(f"[ALERT] Threshold exceeded: ~{round(estimates[i])} deauth packets from {int_to_mac(mac)}"
+                    f"{self._alert_suffix}")
+        return len(alerted)
+
+    def process_batch(self):
+        batch = self.ring.drain()
+        dropped = self.ring.dropped
+        if dropped != self._dropped_reported:
+            self.log_batch.emit(f"[~] Capture ring full, {dropped - self._dropped_reported} frames dropped")
+            self._dropped_reported = dropped
+        if not batch:
+            return
+
+        # Hot loop works on locals only; the attribute lookups happen once per batch
+        fromtimestamp = datetime.fromtimestamp
+        msgs = []
+        log = msgs.append
+        macs = []
+        add_mac = macs.append
+        for ts, mac in batch:
+            add_mac(mac)
+            log(f"[!] Deauth packet detected from {int_to_mac(mac)} at {fromtimestamp(ts).isoformat(timespec='seconds')}")
+        self.total_deauth_packets += len(batch)
+        if self.log_file:
+            self.log_file.write("\n".join(msgs) + "\n")
 
-    def run(self):
-        sniff(iface=self.interface, prn=self.process_packet, stop_filter=lambda x: not self.running)
-
-    def process_packet(self, pkt):
-        if pkt.haslayer(Dot11Deauth):
-            self.total_deauth_packets += 1
-            ts = time.time()
-            self.packet_times.append(ts)
-            mac = pkt.addr2
-            self.suspicious_macs.add(mac)
-            msg = f"[!] Deauth packet detected from {mac} at {time.ctime(ts)}"
-            self.console_output.append(msg)
-            if self.log_path:
-                with open(self.log_path, 'a') as f:
-                    f.write(msg + "\n")
-
-            # Alert logic
-            self.packet_times = [t for t in self.packet_times if ts - t <= self.time_window]
-            if len(self.packet_times) >= self.threshold:
-                alert_msg = f"[ALERT] Threshold exceeded: {len(self.packet_times)} deauth packets in {self.time_window}s"
-                self.console_output.append(alert_msg)
-                self.alerts_triggered += 1
+        # Alert logic, per transmitter so unrelated senders don't add up to a false alert.
+        # Windowing runs on the monotonic clock so wall-clock jumps can't stretch or reset it.
+        now = monotonic()
+        estimates = self.sketch.estimate(self.sketch.add(macs, now), now)
+        self.alerts_triggered += self.alert_scan(macs, estimates, log)
+        self.log_batch.emit("\n".join(msgs))
@@ -3,8 +3,9 @@ from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
     QComboBox, QLineEdit, QTextEdit, QGroupBox, QFormLayout
 )
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import Qt, QTimer
 from detector import DeAuthDetector
+import math
 import time
 
 
@@ -14,6 +15,9 @@ class DeAuthShieldGUI(QWidget):
         self.setWindowTitle("DeAuthShield – WiFi Attack Detector")
         self.start_time = time.time()
         self.detector = None
+        self._last_total = -1
+        self._last_alerts = -1
+        self._last_mac_text = None
 
         self.init_ui()
 
@@ -44,16 +48,23 @@ class DeAuthShieldGUI(QWidget):
         # Console output
         self.console_output = QTextEdit()
         self.console_output.setReadOnly(True)
+        # Rolling buffer: Qt drops the oldest lines past the cap, and there's no undo history to keep
+        self.console_output.document().setMaximumBlockCount(2000)
+        self.console_output.setUndoRedoEnabled(False)
 
-        # Stats
-        self.stats_label = QLabel("Uptime: 0s\nTotal Deauth Packets: 0\nAlerts Triggered: 0\nSuspicious MACs: []")
+        # Stats, one label per line so a change only re-lays out that line
+        self.lbl_uptime = QLabel("Uptime: 0s")
+        self.lbl_total = QLabel("Total Deauth Packets: 0")
+        self.lbl_alerts = QLabel("Alerts Triggered: 0")
+        self.lbl_macs = QLabel("Suspicious MACs: []")
 
         layout.addWidget(form_group)
         layout.addWidget(self.start_button)
         layout.addWidget(QLabel("Console Output:"))
         layout.addWidget(self.console_output)
         layout.addWidget(QLabel("Statistics:"))
-        layout.addWidget(self.stats_label)
+        for label in (self.lbl_uptime, self.lbl_total, self.lbl_alerts, self.lbl_macs):
+            layout.addWidget(label)
 
         self.setLayout(layout)
 
@@ -62,19 +73,48 @@ class DeAuthShieldGUI(QWidget):
 
     def start_monitoring(self):
         interface = self.interface_dropdown.currentText()
-        threshold = int(self.threshold_input.text())
-        time_window = int(self.time_window_input.text())
+        try:
+            threshold = int(self.threshold_input.text())
+            time_window = float(self.time_window_input.text())
+        except ValueError:
+            self.console_output.append("[-] Threshold must be a whole number and the time window a number of seconds")
+            return
+        # float() also accepts "nan" and "inf", which would stop the window from ever sliding
+        if threshold <= 0 or not math.isfinite(time_window) or time_window <= 0:
+            self.console_output.append("[-] Threshold and time window must be finite and greater than zero")
+            return
         log_path = self.log_path_input.text().strip() or None
 
-        self.console_output.append("[+] Monitoring started...")
-        self.detector = DeAuthDetector(interface, threshold, time_window, log_path, self.console_output)
-        self.detector.start()
+        # Restarting replaces the detector, so shut down the old capture thread / tcpdump first
+        if self.detector:
+            self.detector.stop()
+            self.timer.stop()
+        self.detector = DeAuthDetector(interface, threshold, time_window, log_path)
+        self.detector.log_batch.connect(self.console_output.append, Qt.ConnectionType.QueuedConnection)
+        if not self.detector.start():
+            return
+        # Queued behind any fallback notices start() emitted, so the console reads in order
+        self.detector.log_batch.emit("[+] Monitoring started...")
         self.timer.start(1000)
 
+    def closeEvent(self, event):
+        if self.detector:
+            self.detector.stop()
+        event.accept()
+
     def update_stats(self):
         if self.detector:
             uptime = int(time.time() - self.start_time)
-            self.stats_label.setText(f"Uptime: {uptime}s\n"
-                                     f"Total Deauth Packets: {self.detector.total_deauth_packets}\n"
-                                     f"Alerts Triggered: {self.detector.alerts_triggered}\n"
-                                     f"Suspicious MACs: {list(self.detector.suspicious_macs)}")
+            self.lbl_uptime.setText(f"Uptime: {uptime}s")
+            total = self.detector.total_deauth_packets
+            if total != self._last_total:
+                self._last_total = total
+                self.lbl_total.setText(f"Total Deauth Packets: {total}")
+            alerts = self.detector.alerts_triggered
+            if alerts != self._last_alerts:
+                self._last_alerts = alerts
+                self.lbl_alerts.setText(f"Alerts Triggered: {alerts}")
+            mac_text = self.detector.mac_list_text()
+            if mac_text != self._last_mac_text:
+                self._last_mac_text = mac_text
+                self.lbl_macs.setText(f"Suspicious MACs: {mac_text}")